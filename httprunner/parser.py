@@ -1,17 +1,16 @@
 import ast
 import builtins
+import functools
 import inspect
 import json
 import re
 import os
 from typing import Any, Set, Text, Callable, List, Dict, Union, Literal
-from copy import deepcopy
 
 from collections import defaultdict
 from loguru import logger
 from pydantic import BaseModel
 from pydantic.json import pydantic_encoder
-from sentry_sdk import capture_exception
 
 from httprunner import loader, utils, exceptions
 from httprunner.models import VariablesMapping, FunctionsMapping
@@ -24,13 +23,37 @@ dollar_regex_compile = re.compile(r"\$\$")
 variable_regex_compile = re.compile(r"\$\{(\w+)\}|\$(\w+)")
 # function notation, e.g. ${func1($var_1, $var_3)}
 function_regex_compile = re.compile(r"\$\{(\w+)\(([\$\w\.\-/\s=,]*)\)\}")
+# combined template token notation, alternatives ordered by priority:
+# $$ > ${func($a, $b)} > ${var} / $var
+template_token_regex_compile = re.compile(
+    r"(?P<dollar>\$\$)"
+    r"|\$\{(?P<func>\w+)\((?P<params>[\$\w\.\-/\s=,]*)\)\}"
+    r"|\$\{(?P<var1>\w+)\}"
+    r"|\$(?P<var2>\w+)"
+)
+# combined variable token notation, functions excluded on purpose so that
+# variables referenced in function params are still picked up one by one
+variable_token_regex_compile = re.compile(
+    r"(?P<dollar>\$\$)|\$\{(?P<var1>\w+)\}|\$(?P<var2>\w+)"
+)
+
+# None means not resolved yet, allure is imported lazily on first use
+USE_ALLURE = None
+
+
+def _check_allure() -> bool:
+    """ import allure on first use, it is a heavy module and only needed
+        when function arguments are attached to reports.
+    """
+    global USE_ALLURE, allure
+    if USE_ALLURE is None:
+        try:
+            import allure
 
-try:
-    import allure
-
-    USE_ALLURE = True
-except ModuleNotFoundError:
-    USE_ALLURE = False
+            USE_ALLURE = True
+        except ModuleNotFoundError:
+            USE_ALLURE = False
+    return USE_ALLURE
 
 
 class CustomEncoder(json.JSONEncoder):
@@ -42,6 +65,11 @@ class CustomEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+# characters a Python literal can start with, including b/r/u/f string prefixes;
+# anything else is kept as string without paying for ast.literal_eval
+_literal_first_chars = frozenset("0123456789-+.([{'\"brufBRUF")
+
+
 def parse_string_value(str_value: Text) -> Any:
     """ parse string to number if possible
     e.g. "123" => 123
@@ -49,6 +77,17 @@ def parse_string_value(str_value: Text) -> Any:
          "abc" => "abc"
          "$var" => "$var"
     """
+    if not isinstance(str_value, str):
+        # e.g. $var resolved to int/float/bool, keep it unchanged
+        return str_value
+
+    stripped_value = str_value.lstrip()
+    if not stripped_value or (
+        stripped_value[0] not in _literal_first_chars
+        and stripped_value not in ("True", "False", "None")
+    ):
+        return str_value
+
     try:
         return ast.literal_eval(str_value)
     except ValueError:
@@ -91,9 +130,8 @@ def regex_findall_variables(raw_string: Text) -> List[Text]:
         []
 
     """
-    try:
-        match_start_position = raw_string.index("$", 0)
-    except ValueError:
+    match_start_position = raw_string.find("$", 0)
+    if match_start_position == -1:
         return []
 
     vars_list = []
@@ -102,25 +140,18 @@ def regex_findall_variables(raw_string: Text) -> List[Text]:
         # Notice: notation priority
         # $$ > $var
 
-        # search $$
-        dollar_match = dollar_regex_compile.match(raw_string, match_start_position)
-        if dollar_match:
-            match_start_position = dollar_match.end()
-            continue
-
-        # search variable like ${var} or $var
-        var_match = variable_regex_compile.match(raw_string, match_start_position)
-        if var_match:
-            var_name = var_match.group(1) or var_match.group(2)
-            vars_list.append(var_name)
-            match_start_position = var_match.end()
+        token_match = variable_token_regex_compile.match(raw_string, match_start_position)
+        if token_match:
+            if not token_match.group("dollar"):
+                vars_list.append(
+                    token_match.group("var1") or token_match.group("var2")
+                )
+            match_start_position = token_match.end()
             continue
 
-        curr_position = match_start_position
-        try:
-            # find next $ location
-            match_start_position = raw_string.index("$", curr_position + 1)
-        except ValueError:
+        # find next $ location
+        match_start_position = raw_string.find("$", match_start_position + 1)
+        if match_start_position == -1:
             # break while loop
             break
 
@@ -156,29 +187,33 @@ def regex_findall_functions(content: Text) -> List[Text]:
     try:
         return function_regex_compile.findall(content)
     except TypeError as ex:
+        # sentry_sdk is only needed on this error path, import it lazily
+        from sentry_sdk import capture_exception
+
         capture_exception(ex)
         return []
 
 
-def extract_variables(content: Any) -> Set:
-    """ extract all variables in content recursively.
+def extract_variables(content: Any, include_dict_keys: bool = False) -> Set:
+    """ extract all variables in content, walking nested containers iteratively.
+        dict keys are skipped unless include_dict_keys is set; parse_data parses
+        keys too, thus dependency tracking needs them.
     """
-    if isinstance(content, (list, set, tuple)):
-        variables = set()
-        for item in content:
-            variables = variables | extract_variables(item)
-        return variables
-
-    elif isinstance(content, dict):
-        variables = set()
-        for key, value in content.items():
-            variables = variables | extract_variables(value)
-        return variables
-
-    elif isinstance(content, str):
-        return set(regex_findall_variables(content))
-
-    return set()
+    variables = set()
+    stack = [content]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if "$" in item:
+                variables.update(regex_findall_variables(item))
+        elif isinstance(item, dict):
+            if include_dict_keys:
+                stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, set, tuple)):
+            stack.extend(item)
+
+    return variables
 
 
 def parse_function_params(params: Text) -> Dict:
@@ -211,23 +246,53 @@ def parse_function_params(params: Text) -> Dict:
         >>> parse_function_params("1, 2, a=3, b=4")
         {'args': [1, 2], 'kwargs': {'a':3, 'b':4}}
 
+        >>> parse_function_params("a=1, b=YWJjZA==")
+        {'args': [], 'kwargs': {'a': 1, 'b': 'YWJjZA=='}}
+
     """
-    function_meta = {"args": [], "kwargs": {}}
+    args, kwargs_items = _parse_function_params_cached(params)
+    return {"args": list(args), "kwargs": dict(kwargs_items)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_function_params_cached(params: Text) -> tuple:
+    """ parse function params into immutable (args, kwargs_items) tuples.
 
+        Params strings repeat on every invocation of the same template, thus results
+        are memoized; tuples keep the cached values safe from caller mutation.
+    """
     params_str = params.strip()
     if params_str == "":
-        return function_meta
+        return (), ()
+
+    try:
+        # parse params as a whole call expression, handling literal args and
+        # kwargs in one pass
+        call_node = ast.parse(f"_f({params_str})", mode="eval").body
+        return (
+            tuple(ast.literal_eval(arg) for arg in call_node.args),
+            tuple(
+                (keyword.arg, ast.literal_eval(keyword.value))
+                for keyword in call_node.keywords
+            ),
+        )
+    except (SyntaxError, ValueError, TypeError):
+        # params contain non-literal tokens, e.g. $var references or bare words
+        pass
 
-    args_list = params_str.split(",")
+    args = []
+    kwargs_items = []
+    args_list = [params_str] if "," not in params_str else params_str.split(",")
     for arg in args_list:
         arg = arg.strip()
         if "=" in arg:
-            key, value = arg.split("=")
-            function_meta["kwargs"][key.strip()] = parse_string_value(value.strip())
+            # split on the first = only, values may contain = (e.g. base64 padding)
+            key, value = arg.split("=", 1)
+            kwargs_items.append((key.strip(), parse_string_value(value.strip())))
         else:
-            function_meta["args"].append(parse_string_value(arg))
+            args.append(parse_string_value(arg))
 
-    return function_meta
+    return tuple(args), tuple(kwargs_items)
 
 
 def get_mapping_variable(
@@ -255,6 +320,29 @@ def get_mapping_variable(
         )
 
 
+_function_registry: Dict[Text, Callable] = {}
+
+
+def _get_function_registry() -> Dict[Text, Callable]:
+    """ build static function lookup table on first use:
+        HttpRunner builtin functions plus alias entries.
+    """
+    if not _function_registry:
+        _function_registry.update(loader.load_builtin_functions())
+        _function_registry["parameterize"] = loader.load_csv_file
+        _function_registry["P"] = loader.load_csv_file
+        _function_registry["environ"] = utils.get_os_environ
+        _function_registry["ENV"] = utils.get_os_environ
+
+        # extension for upload test, imported here to avoid circular import
+        from httprunner.ext import uploader
+
+        _function_registry["multipart_encoder"] = uploader.multipart_encoder
+        _function_registry["multipart_content_type"] = uploader.multipart_content_type
+
+    return _function_registry
+
+
 def get_mapping_function(
     function_name: Text, functions_mapping: FunctionsMapping
 ) -> Callable:
@@ -275,24 +363,9 @@ def get_mapping_function(
     if function_name in functions_mapping:
         return functions_mapping[function_name]
 
-    elif function_name in ["parameterize", "P"]:
-        return loader.load_csv_file
-
-    elif function_name in ["environ", "ENV"]:
-        return utils.get_os_environ
-
-    elif function_name in ["multipart_encoder", "multipart_content_type"]:
-        # extension for upload test
-        from httprunner.ext import uploader
-
-        return getattr(uploader, function_name)
-
-    try:
-        # check if HttpRunner builtin functions
-        built_in_functions = loader.load_builtin_functions()
-        return built_in_functions[function_name]
-    except KeyError:
-        pass
+    function_registry = _get_function_registry()
+    if function_name in function_registry:
+        return function_registry[function_name]
 
     try:
         # check if Python builtin functions
@@ -303,25 +376,55 @@ def get_mapping_function(
     raise exceptions.FunctionNotFound(f"{function_name} is not found.")
 
 
+@functools.lru_cache(maxsize=256)
+def _get_pydantic_field_names(model_class: type) -> tuple:
+    """ get field names of pydantic model class, memoized per class.
+    """
+    return tuple(model_class.__fields__)
+
+
 def get_pydantic_object_id_recursively(obj: BaseModel, depth: int = 2) -> dict:
     """
     Get id of pydantic object, and get ids of fields if fields are pydantic object too.
+    Walks the object graph with an explicit stack instead of Python recursion.
     """
-    id_dict = {"self": id(obj)}
+    outer_dict = {"self": id(obj)}
 
-    if depth > 0:
+    stack = [(obj, depth, outer_dict)]
+    while stack:
+        obj, depth, id_dict = stack.pop()
+        if depth <= 0:
+            continue
         depth -= 1
+
+        # read field values from the underlying __dict__ where possible,
+        # bypassing per-field descriptor lookups
+        obj_dict = vars(obj)
         fields_ids = {}
-        for field_name in obj.__fields__:
-            value = getattr(obj, field_name)
+        for field_name in _get_pydantic_field_names(type(obj)):
+            if field_name in obj_dict:
+                value = obj_dict[field_name]
+            else:
+                value = getattr(obj, field_name)
+
             if isinstance(value, BaseModel):
-                fields_ids[field_name] = get_pydantic_object_id_recursively(value, depth)
+                field_dict = {"self": id(value)}
+                fields_ids[field_name] = field_dict
+                stack.append((value, depth, field_dict))
             elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
-                fields_ids[field_name] = get_pydantic_objects_ids_recursively(value, depth)
+                field_dict = {"self": id(value)}
+                if depth > 0:
+                    elements = []
+                    field_dict["elements"] = elements
+                    for element in value:
+                        element_dict = {"self": id(element)}
+                        elements.append(element_dict)
+                        stack.append((element, depth - 1, element_dict))
+                fields_ids[field_name] = field_dict
 
         if fields_ids:
             id_dict["fields"] = fields_ids
-    return id_dict
+    return outer_dict
 
 
 def get_pydantic_objects_ids_recursively(objs: list[BaseModel], depth: int = 2) -> dict:
@@ -354,11 +457,12 @@ def report_function_args(
             except AttributeError:
                 pass
 
-        # try to dump to avoid error when dumps
+        # serialize once: both the dump check and the IN snapshot reuse the result
         try:
-            json.dumps(value, cls=CustomEncoder)
+            rendered_value = json.dumps(value, cls=CustomEncoder)
         except TypeError:
             value = repr(value)
+            rendered_value = None
 
         if flag == "IN":
             if isinstance(value, BaseModel):
@@ -373,12 +477,189 @@ def report_function_args(
                 "id": value_id
             }
 
-            # deepcopy object before dumps as snapshot
-            value = deepcopy(value)
+            # snapshot value before function execution; a JSON round-trip is one
+            # linear serialization pass while deepcopy walks the full object graph
+            if rendered_value is not None:
+                value = json.loads(rendered_value)
 
         report_dict[name][flag] = value
 
 
+# compiled template op kinds, one byte per op
+_OP_LITERAL = ord("L")
+_OP_VARIABLE = ord("V")
+_OP_FUNCTION = ord("F")
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_template(raw_string: Text) -> tuple:
+    """ compile raw string into parallel (kinds, payloads) arrays, one entry per op:
+        kind _OP_LITERAL with the literal chunk, _OP_VARIABLE with the variable name,
+        or _OP_FUNCTION with a (name, params) tuple.
+
+        Templates repeat across test steps and parameterized iterations, thus compiled
+        ops are memoized by raw string, so the regex scan runs only once per template.
+        Storing kinds as bytes keeps one object per plan instead of a tuple per op.
+    """
+    kinds = bytearray()
+    payloads = []
+    literal_parts = []
+
+    def flush_literal():
+        if literal_parts:
+            kinds.append(_OP_LITERAL)
+            payloads.append("".join(literal_parts))
+            del literal_parts[:]
+
+    match_start_position = raw_string.find("$", 0)
+    if match_start_position == -1:
+        return b"L", (raw_string,)
+    if match_start_position > 0:
+        literal_parts.append(raw_string[0:match_start_position])
+
+    while match_start_position < len(raw_string):
+
+        # Notice: notation priority
+        # $$ > ${func($a, $b)} > $var
+
+        token_match = template_token_regex_compile.match(raw_string, match_start_position)
+        if token_match:
+            if token_match.group("dollar"):
+                literal_parts.append("$")
+            elif token_match.group("func"):
+                flush_literal()
+                kinds.append(_OP_FUNCTION)
+                payloads.append(
+                    (token_match.group("func"), token_match.group("params"))
+                )
+            else:
+                flush_literal()
+                kinds.append(_OP_VARIABLE)
+                payloads.append(
+                    token_match.group("var1") or token_match.group("var2")
+                )
+            match_start_position = token_match.end()
+            continue
+
+        curr_position = match_start_position
+        # find next $ location
+        match_start_position = raw_string.find("$", curr_position + 1)
+        if match_start_position == -1:
+            literal_parts.append(raw_string[curr_position:])
+            # break while loop
+            match_start_position = len(raw_string)
+        else:
+            literal_parts.append(raw_string[curr_position:match_start_position])
+
+    flush_literal()
+    return bytes(kinds), tuple(payloads)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_attach_settings() -> tuple:
+    """ read ATTACH_ALL_FUNCTIONS / OBJECT_ID_DEPTH environment variables once.
+
+        These do not change during a run, thus they are cached on first use
+        (after the project .env has been loaded into os.environ).
+    """
+    # note: compare with string 'true'
+    attach_all_functions = os.environ.get("ATTACH_ALL_FUNCTIONS") == "true"
+
+    # try to get depth from .env, set default depth to 2
+    try:
+        object_id_depth = int(os.environ.get("OBJECT_ID_DEPTH") or 2)
+    except (ValueError, TypeError):
+        object_id_depth = 2
+
+    return attach_all_functions, object_id_depth
+
+
+@functools.lru_cache(maxsize=512)
+def _get_function_param_names(func: Callable) -> Union[tuple, None]:
+    """ get parameter names of function, None if its signature is unavailable.
+
+        inspect.signature builds a Signature object on every call, thus names are
+        memoized per function object.
+    """
+    try:
+        return tuple(inspect.signature(func).parameters)
+    except ValueError:
+        return None
+
+
+def _eval_function(
+        func_name: Text,
+        func_params_str: Text,
+        variables_mapping: VariablesMapping,
+        functions_mapping: FunctionsMapping,
+) -> Any:
+    """ evaluate one ${func(...)} reference with variables and functions mapping.
+    """
+    func = get_mapping_function(func_name, functions_mapping)
+
+    function_meta = parse_function_params(func_params_str)
+    args = function_meta["args"]
+    kwargs = function_meta["kwargs"]
+    parsed_args = parse_data(args, variables_mapping, functions_mapping)
+    parsed_kwargs = parse_data(kwargs, variables_mapping, functions_mapping)
+
+    # attach function arguments detail to Allure if True
+    is_attach_function = False
+
+    if _check_allure():
+        attach_all_functions, object_id_depth = _get_attach_settings()
+        attach_functions = variables_mapping.get("ATTACH_FUNCTIONS", [])
+
+        if attach_all_functions or func_name in attach_functions:
+            is_attach_function = True
+
+    if is_attach_function:
+        # get all names and values of all arguments
+        all_args_values = [*parsed_args, *list(parsed_kwargs.values())]
+        param_names = _get_function_param_names(func)
+        if param_names is not None:
+            all_args_names = list(param_names)
+        else:
+            all_args_names = list(range(len(all_args_values)))
+        report_dict = defaultdict(dict)
+
+        # log before function execution
+        report_function_args(report_dict, "IN", all_args_names, all_args_values, depth=object_id_depth)
+
+    try:
+        func_eval_value = func(*parsed_args, **parsed_kwargs)
+
+        if is_attach_function:
+            # log after function execution
+            report_function_args(report_dict, "OUT", all_args_names, all_args_values, depth=object_id_depth)
+
+            allure.attach(
+                json.dumps(report_dict, ensure_ascii=False, indent=4, cls=CustomEncoder),
+                f"function: {func_name}({', '.join([str(arg) for arg in all_args_names])})",
+                allure.attachment_type.JSON
+            )
+
+    except Exception as ex:
+        logger.error(
+            f"call function error:\n"
+            f"func_name: {func_name}\n"
+            f"args: {parsed_args}\n"
+            f"kwargs: {parsed_kwargs}\n"
+            f"{type(ex).__name__}: {ex}"
+        )
+
+        # attach to report if exception raised
+        if is_attach_function:
+            allure.attach(
+                json.dumps(report_dict, ensure_ascii=False, indent=4, cls=CustomEncoder),
+                f"function: {func_name}({', '.join([str(arg) for arg in all_args_names])})",
+                allure.attachment_type.JSON
+            )
+        raise
+
+    return func_eval_value
+
+
 def parse_string(
         raw_string: Text,
         variables_mapping: VariablesMapping,
@@ -402,143 +683,75 @@ def parse_string(
             "abc4def"
 
     """
-    try:
-        match_start_position = raw_string.index("$", 0)
-        parsed_string = raw_string[0:match_start_position]
-    except ValueError:
-        parsed_string = raw_string
-        return parsed_string
-
-    while match_start_position < len(raw_string):
-
-        # Notice: notation priority
-        # $$ > ${func($a, $b)} > $var
+    if "$" not in raw_string:
+        return raw_string
+
+    kinds, payloads = _compile_template(raw_string)
+
+    # raw_string is a single variable or function, e.g. "$var" or "${add_one(3)}",
+    # return its value directly to keep native type
+    if kinds == b"V":
+        return get_mapping_variable(payloads[0], variables_mapping)
+    if kinds == b"F":
+        func_name, func_params_str = payloads[0]
+        return _eval_function(
+            func_name, func_params_str, variables_mapping, functions_mapping
+        )
 
-        # search $$
-        dollar_match = dollar_regex_compile.match(raw_string, match_start_position)
-        if dollar_match:
-            match_start_position = dollar_match.end()
-            parsed_string += "$"
-            continue
+    # resolve each referenced variable once, repeated references reuse the value
+    var_names = {
+        payloads[index]
+        for index, kind in enumerate(kinds)
+        if kind == _OP_VARIABLE
+    }
+    var_values = {}
+    if var_names:
+        try:
+            var_values = {name: variables_mapping[name] for name in var_names}
+        except KeyError as ex:
+            raise exceptions.VariableNotFound(
+                f"{ex.args[0]} not found in {variables_mapping}"
+            )
 
-        # search function like ${func($a, $b)}
-        func_match = function_regex_compile.match(raw_string, match_start_position)
-        if func_match:
-            func_name = func_match.group(1)
-            func = get_mapping_function(func_name, functions_mapping)
-
-            func_params_str = func_match.group(2)
-            function_meta = parse_function_params(func_params_str)
-            args = function_meta["args"]
-            kwargs = function_meta["kwargs"]
-            parsed_args = parse_data(args, variables_mapping, functions_mapping)
-            parsed_kwargs = parse_data(kwargs, variables_mapping, functions_mapping)
-
-            # get all names and values of all arguments
-            all_args_values = [*parsed_args, *list(parsed_kwargs.values())]
-            try:
-                all_args_names = list(inspect.signature(func).parameters.keys())
-            except ValueError:
-                all_args_names = list(range(len(all_args_values)))
-            report_dict = defaultdict(dict)
-
-            # attach function arguments detail to Allure if True
-            is_attach_function = False
-
-            # set default depth to 2
-            object_id_depth = 2
-
-            if USE_ALLURE:
-                env_attach_all_functions = os.environ.get("ATTACH_ALL_FUNCTIONS")
-                attach_functions = variables_mapping.get("ATTACH_FUNCTIONS", [])
-
-                # note: compare with string 'true'
-                if env_attach_all_functions == "true" or func_name in attach_functions:
-                    is_attach_function = True
-
-                    # try to get depth from .env
-                    env_object_id_depth = os.environ.get("OBJECT_ID_DEPTH")
-                    if env_object_id_depth:
-                        try:
-                            object_id_depth = int(env_object_id_depth)
-                        except ValueError:
-                            pass
-                        except TypeError:
-                            pass
-
-            if is_attach_function:
-                # log before function execution
-                report_function_args(report_dict, "IN", all_args_names, all_args_values, depth=object_id_depth)
+    return _render_plan(
+        kinds, payloads, var_values, variables_mapping, functions_mapping
+    )
 
-            try:
-                func_eval_value = func(*parsed_args, **parsed_kwargs)
 
-                if is_attach_function:
-                    # log after function execution
-                    report_function_args(report_dict, "OUT", all_args_names, all_args_values, depth=object_id_depth)
+def _render_plan(
+        kinds: bytes,
+        payloads: tuple,
+        var_values: Dict,
+        variables_mapping: VariablesMapping,
+        functions_mapping: FunctionsMapping,
+) -> Text:
+    """ render a compiled multi-token plan into its string value.
 
-                    allure.attach(
-                        json.dumps(report_dict, ensure_ascii=False, indent=4, cls=CustomEncoder),
-                        f"function: {func_name}({', '.join([str(arg) for arg in all_args_names])})",
-                        allure.attachment_type.JSON
+        This inner loop runs for every templated string of every step; globals
+        are bound to locals up front to cut interpreter dispatch per op.
+    """
+    op_literal = _OP_LITERAL
+    op_variable = _OP_VARIABLE
+    to_str = str
+    eval_function = _eval_function
+
+    parsed_parts = []
+    append_part = parsed_parts.append
+    for kind, payload in zip(kinds, payloads):
+        if kind == op_literal:
+            append_part(payload)
+        elif kind == op_variable:
+            append_part(to_str(var_values[payload]))
+        else:
+            append_part(
+                to_str(
+                    eval_function(
+                        payload[0], payload[1], variables_mapping, functions_mapping
                     )
-
-            except Exception as ex:
-                logger.error(
-                    f"call function error:\n"
-                    f"func_name: {func_name}\n"
-                    f"args: {parsed_args}\n"
-                    f"kwargs: {parsed_kwargs}\n"
-                    f"{type(ex).__name__}: {ex}"
                 )
+            )
 
-                # attach to report if exception raised
-                if is_attach_function:
-                    allure.attach(
-                        json.dumps(report_dict, ensure_ascii=False, indent=4, cls=CustomEncoder),
-                        f"function: {func_name}({', '.join([str(arg) for arg in all_args_names])})",
-                        allure.attachment_type.JSON
-                    )
-                raise
-
-            func_raw_str = "${" + func_name + f"({func_params_str})" + "}"
-            if func_raw_str == raw_string:
-                # raw_string is a function, e.g. "${add_one(3)}", return its eval value directly
-                return func_eval_value
-
-            # raw_string contains one or many functions, e.g. "abc${add_one(3)}def"
-            parsed_string += str(func_eval_value)
-            match_start_position = func_match.end()
-            continue
-
-        # search variable like ${var} or $var
-        var_match = variable_regex_compile.match(raw_string, match_start_position)
-        if var_match:
-            var_name = var_match.group(1) or var_match.group(2)
-            var_value = get_mapping_variable(var_name, variables_mapping)
-
-            if f"${var_name}" == raw_string or "${" + var_name + "}" == raw_string:
-                # raw_string is a variable, $var or ${var}, return its value directly
-                return var_value
-
-            # raw_string contains one or many variables, e.g. "abc${var}def"
-            parsed_string += str(var_value)
-            match_start_position = var_match.end()
-            continue
-
-        curr_position = match_start_position
-        try:
-            # find next $ location
-            match_start_position = raw_string.index("$", curr_position + 1)
-            remain_string = raw_string[curr_position:match_start_position]
-        except ValueError:
-            remain_string = raw_string[curr_position:]
-            # break while loop
-            match_start_position = len(raw_string)
-
-        parsed_string += remain_string
-
-    return parsed_string
+    return "".join(parsed_parts)
 
 
 def parse_data(
@@ -550,11 +763,15 @@ def parse_data(
         Notice: variables_mapping should not contain any variable or function.
     """
     if isinstance(raw_data, str):
+        # only strip whitespaces and tabs, \n\r is left because they maybe used in changeset
+        raw_data = raw_data.strip(" \t")
+        if "$" not in raw_data:
+            # no variable or function in string, no need to parse
+            return raw_data
+
         # content in string format may contains variables and functions
         variables_mapping = variables_mapping or {}
         functions_mapping = functions_mapping or {}
-        # only strip whitespaces and tabs, \n\r is left because they maybe used in changeset
-        raw_data = raw_data.strip(" \t")
         return parse_string(raw_data, variables_mapping, functions_mapping)
 
     elif isinstance(raw_data, (list, set, tuple)):
@@ -565,8 +782,17 @@ def parse_data(
     elif isinstance(raw_data, dict):
         parsed_data = {}
         for key, value in raw_data.items():
-            parsed_key = parse_data(key, variables_mapping, functions_mapping)
-            parsed_value = parse_data(value, variables_mapping, functions_mapping)
+            # keys and most values are constant literals, recurse only when needed
+            if isinstance(key, str) and "$" not in key:
+                parsed_key = key.strip(" \t")
+            else:
+                parsed_key = parse_data(key, variables_mapping, functions_mapping)
+
+            if isinstance(value, str) and "$" not in value:
+                parsed_value = value.strip(" \t")
+            else:
+                parsed_value = parse_data(value, variables_mapping, functions_mapping)
+
             parsed_data[parsed_key] = parsed_value
 
         return parsed_data
@@ -582,39 +808,53 @@ def parse_variables_mapping(
 
     parsed_variables: VariablesMapping = {}
 
-    while len(parsed_variables) != len(variables_mapping):
-        for var_name in variables_mapping:
-
-            if var_name in parsed_variables:
-                continue
-
-            var_value = variables_mapping[var_name]
-            variables = extract_variables(var_value)
-
-            # check if reference variable itself
-            if var_name in variables:
-                # e.g.
-                # variables_mapping = {"token": "abc$token"}
-                # variables_mapping = {"key": ["$key", 2]}
-                raise exceptions.VariableNotFound(var_name)
-
-            # check if reference variable not in variables_mapping
-            not_defined_variables = [
-                v_name for v_name in variables if v_name not in variables_mapping
-            ]
-            if not_defined_variables:
-                # e.g. {"varA": "123$varB", "varB": "456$varC"}
-                # e.g. {"varC": "${sum_two($a, $b)}"}
-                raise exceptions.VariableNotFound(not_defined_variables)
-
-            try:
-                parsed_value = parse_data(
-                    var_value, parsed_variables, functions_mapping
-                )
-            except exceptions.VariableNotFound:
-                continue
-
-            parsed_variables[var_name] = parsed_value
+    # build dependency graph once, extracting variables of each value a single time
+    dependencies: Dict[Text, Set] = {}
+    dependents: Dict[Text, List] = defaultdict(list)
+    for var_name, var_value in variables_mapping.items():
+        variables = extract_variables(var_value, include_dict_keys=True)
+
+        # check if reference variable itself
+        if var_name in variables:
+            # e.g.
+            # variables_mapping = {"token": "abc$token"}
+            # variables_mapping = {"key": ["$key", 2]}
+            raise exceptions.VariableNotFound(var_name)
+
+        # check if reference variable not in variables_mapping
+        not_defined_variables = [
+            v_name for v_name in variables if v_name not in variables_mapping
+        ]
+        if not_defined_variables:
+            # e.g. {"varA": "123$varB", "varB": "456$varC"}
+            # e.g. {"varC": "${sum_two($a, $b)}"}
+            raise exceptions.VariableNotFound(not_defined_variables)
+
+        dependencies[var_name] = variables
+        for referenced_name in variables:
+            dependents[referenced_name].append(var_name)
+
+    # resolve variables in dependency order (Kahn's algorithm)
+    ready = [var_name for var_name, deps in dependencies.items() if not deps]
+    while ready:
+        var_name = ready.pop()
+        parsed_variables[var_name] = parse_data(
+            variables_mapping[var_name], parsed_variables, functions_mapping
+        )
+        for dependent_name in dependents[var_name]:
+            deps = dependencies[dependent_name]
+            deps.discard(var_name)
+            if not deps:
+                ready.append(dependent_name)
+
+    if len(parsed_variables) != len(variables_mapping):
+        # circular reference, e.g. {"varA": "$varB", "varB": "$varA"}
+        unresolved_variables = [
+            var_name
+            for var_name in variables_mapping
+            if var_name not in parsed_variables
+        ]
+        raise exceptions.VariableNotFound(unresolved_variables)
 
     return parsed_variables
 
@@ -251,12 +251,9 @@ def gen_cartesian_product(*args: List[Dict]) -> List[Dict]:
     elif len(args) == 1:
         return args[0]
 
-    product_list = []
-    for product_item_tuple in itertools.product(*args):
-        product_item_dict = {}
-        for item in product_item_tuple:
-            product_item_dict.update(item)
-
-        product_list.append(product_item_dict)
-
-    return product_list
+    # merge each product combination in a single dict comprehension, combinations
+    # themselves are streamed by itertools.product
+    return [
+        {key: value for item in product_item_tuple for key, value in item.items()}
+        for product_item_tuple in itertools.product(*args)
+    ]
@@ -15,11 +15,22 @@ class TestParserBasic(unittest.TestCase):
         self.assertEqual(parsed_variables["varA"], "123")
         self.assertEqual(parsed_variables["varB"], "123")
 
+    def test_parse_variables_mapping_dict_key_reference(self):
+        variables = {"b": "x", "a": {"$b": 1}}
+        parsed_variables = parser.parse_variables_mapping(variables)
+        self.assertEqual(parsed_variables["b"], "x")
+        self.assertEqual(parsed_variables["a"], {"x": 1})
+
     def test_parse_variables_mapping_exception(self):
         variables = {"varA": "$varB", "varB": "$varC", "a": 1, "b": 2}
         with self.assertRaises(VariableNotFound):
             parser.parse_variables_mapping(variables)
 
+    def test_parse_variables_mapping_circular_reference(self):
+        variables = {"varA": "$varB", "varB": "$varA"}
+        with self.assertRaises(VariableNotFound):
+            parser.parse_variables_mapping(variables)
+
     def test_parse_string_value(self):
         self.assertEqual(parser.parse_string_value("123"), 123)
         self.assertEqual(parser.parse_string_value("12.3"), 12.3)
@@ -90,6 +101,14 @@ class TestParserBasic(unittest.TestCase):
             parser.parse_function_params("$request, 12 3"),
             {"args": ["$request", "12 3"], "kwargs": {}},
         )
+        self.assertEqual(
+            parser.parse_function_params("a=1, b=YWJjZA=="),
+            {"args": [], "kwargs": {"a": 1, "b": "YWJjZA=="}},
+        )
+        self.assertEqual(
+            parser.parse_function_params("content-type=application/json"),
+            {"args": [], "kwargs": {"content-type": "application/json"}},
+        )
 
     def test_extract_functions(self):
         self.assertEqual(parser.regex_findall_functions("${func()}"), [("func", "")])